@@ -12,7 +12,13 @@ from .common_types import (
     VotingResults,
 )
 from .config import Config, logger
-from .utils import save_base64_audio_to_file, validate_env_var
+from .utils import (
+    delete_old_audio_files_periodically,
+    save_base64_audio_to_file,
+    track_audio_file,
+    validate_env_var,
+    wait_for_retry_after,
+)
 
 __all__ = [
     "ComparisonType",
@@ -27,8 +33,11 @@ __all__ = [
     "TTSProviderName",
     "VotingResults",
     "constants",
+    "delete_old_audio_files_periodically",
     "logger",
     "save_base64_audio_to_file",
+    "track_audio_file",
     "utils",
     "validate_env_var",
+    "wait_for_retry_after",
 ]
@@ -1,4 +1,5 @@
 # Standard Library Imports
+from dataclasses import dataclass
 from typing import List, Literal, NamedTuple, Optional, TypedDict
 
 TTSProviderName = Literal["Hume AI", "ElevenLabs", "OpenAI"]
@@ -33,14 +34,15 @@ class Option(NamedTuple):
     Attributes:
         provider (TTSProviderName): The TTS provider that generated the audio.
         audio (str): The relative file path to the audio file produced by the TTS provider.
-        generation_id (str): The unique identifier for this TTS generation.
+        generation_id (Optional[str]): The unique identifier for this TTS generation, or None if not available.
     """
     provider: TTSProviderName
     audio: str
-    generation_id: str
+    generation_id: Optional[str]
 
 
-class VotingResults(TypedDict):
+@dataclass(slots=True, frozen=True)
+class VotingResults:
     """Voting results data structure representing values we want to persist to the votes DB"""
     comparison_type: ComparisonType
     winning_provider: TTSProviderName
@@ -22,6 +22,7 @@ class Config:
     debug: bool
     database_url: Optional[str]
     audio_dir: Path
+    audio_dir_relative: Path
     anthropic_config: "AnthropicConfig"
     hume_config: "HumeConfig"
     elevenlabs_config: "ElevenLabsConfig"
@@ -59,11 +60,18 @@ class Config:
         logger.info(f'App running in "{app_env}" mode.')
         logger.info(f"Debug mode is {'enabled' if debug else 'disabled'}.")
 
-        # Define the directory for audio files relative to the project root
-        audio_dir = Path.cwd() / "static" / "audio"
+        # Define the directory for audio files, relative to the project root unless overridden (e.g. to point at a
+        # RAM-backed tmpfs such as /dev/shm, since audio files are short-lived)
+        cwd = Path.cwd()
+        audio_dir_override = os.getenv("AUDIO_DIR")
+        audio_dir = Path(audio_dir_override).resolve() if audio_dir_override else cwd / "static" / "audio"
         audio_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.debug(f"Audio directory set to {audio_dir}")
+        # Precompute the audio directory relative to the project root, used when returning paths to saved audio files.
+        # Directories outside the project root are used as absolute paths.
+        audio_dir_relative = audio_dir.relative_to(cwd) if audio_dir.is_relative_to(cwd) else audio_dir
+
+        logger.debug("Audio directory set to %s", audio_dir)
 
         if debug:
             logger.debug("DEBUG mode enabled.")
@@ -75,6 +83,7 @@ class Config:
             debug=debug,
             database_url=database_url,
             audio_dir=audio_dir,
+            audio_dir_relative=audio_dir_relative,
             anthropic_config=AnthropicConfig(),
             hume_config=HumeConfig(),
             elevenlabs_config=ElevenLabsConfig(),
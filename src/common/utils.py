@@ -1,12 +1,59 @@
 # Standard Library Imports
-import base64
+import asyncio
+import binascii
+import heapq
 import os
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
+
+# Third-Party Library Imports
+from tenacity import RetryCallState
 
 # Local Application Imports
 from .config import Config, logger
 
+# pybase64 is a SIMD-accelerated drop-in for the standard library's base64 decoder. It is a declared dependency, but
+# fall back to the standard library in environments that haven't synced it.
+try:
+    from pybase64 import b64decode as _b64decode
+except ImportError:
+    from binascii import a2b_base64 as _b64decode  # type: ignore[assignment]
+
+# Size of each base64 slice decoded and written at a time. Must be a multiple of 4 so that every slice
+# decodes independently of its neighbours.
+_BASE64_DECODE_CHUNK_SIZE = 64 * 1024
+
+# Number of seconds between background sweeps of the audio directory for old files, and the age in minutes after
+# which audio files are deleted
+_AUDIO_CLEANUP_INTERVAL_SECONDS = 60.0
+_AUDIO_FILE_MAX_AGE_MINUTES = 30
+# Every Nth sweep rescans the whole directory, as a backstop for files that were never tracked (e.g. written by
+# another process)
+_AUDIO_FULL_SWEEP_EVERY = 10
+# Min-heap of (modification time, path) for every audio file written by this process (plus any found by the last
+# full sweep), so that the sweeps in between only touch expired files instead of rescanning the directory.
+_tracked_audio_files: List[Tuple[float, str]] = []
+_tracked_audio_files_lock = threading.Lock()
+_audio_cleanup_sweeps = 0
+
+def track_audio_file(file_path: Union[str, Path], mod_time: Optional[float] = None) -> None:
+    """
+    Registers an audio file for deletion by the periodic cleanup once it is older than the age threshold.
+
+    Audio files written outside of `save_base64_audio_to_file` (e.g. streamed directly to disk) should be registered
+    with this function.
+
+    Args:
+        file_path (Union[str, Path]): The path to the audio file.
+        mod_time (Optional[float]): The file's modification time in seconds since the epoch. Defaults to now.
+
+    Returns: None
+    """
+    with _tracked_audio_files_lock:
+        heapq.heappush(_tracked_audio_files, (time.time() if mod_time is None else mod_time, str(file_path)))
 
 def _delete_files_older_than(directory: Path, minutes: int = 30) -> None:
     """
@@ -14,6 +61,7 @@ def _delete_files_older_than(directory: Path, minutes: int = 30) -> None:
 
     This function checks each file in the given directory and removes it if its last modification
     time is older than the specified threshold. By default, the threshold is set to 30 minutes.
+    Files that are kept are tracked, so that later sweeps can delete them without rescanning the directory.
 
     Args:
         directory (str): The path to the directory where files will be checked and possibly deleted.
@@ -22,32 +70,160 @@ def _delete_files_older_than(directory: Path, minutes: int = 30) -> None:
 
     Returns: None
     """
+    # The scan re-tracks every file it keeps, so start from an empty heap rather than accumulating duplicates.
+    with _tracked_audio_files_lock:
+        _tracked_audio_files.clear()
+
     # Get the current time in seconds since the epoch.
     now = time.time()
     # Convert the minutes threshold to seconds.
     cutoff = now - (minutes * 60)
-    dir_path = Path(directory)
-
-    # Iterate over all files in the directory.
-    for file_path in dir_path.iterdir():
-        if file_path.is_file():
-            file_mod_time = file_path.stat().st_mtime
-            # If the file's modification time is older than the cutoff, delete it.
-            if file_mod_time < cutoff:
-                try:
-                    file_path.unlink()
-                    logger.info(f"Deleted: {file_path}")
-                except Exception as e:
-                    logger.exception(f"Error deleting {file_path}: {e}")
-
-def save_base64_audio_to_file(base64_audio: str, filename: str, config: Config) -> str:
+
+    # Iterate over all files in the directory. os.scandir reuses the file type information returned while reading the
+    # directory, avoiding a separate stat call per entry just to check whether it is a file. Files are unlinked
+    # relative to an open descriptor for the directory, so the kernel doesn't resolve the full path for each one.
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    file_mod_time = entry.stat(follow_symlinks=False).st_mtime
+                    # If the file's modification time is older than the cutoff, delete it.
+                    if file_mod_time < cutoff:
+                        try:
+                            os.unlink(entry.name, dir_fd=dir_fd)  # noqa: PTH108
+                            logger.debug("Deleted: %s", entry.path)
+                        except Exception as e:
+                            logger.warning("Error deleting %s: %s", entry.path, e)
+                    else:
+                        track_audio_file(entry.path, file_mod_time)
+    finally:
+        os.close(dir_fd)
+
+def _delete_tracked_files_older_than(minutes: int = 30) -> None:
+    """
+    Delete all tracked files that are older than a given number of minutes, without scanning their directory.
+
+    Args:
+        minutes (int, optional): The age threshold in minutes. Files older than this will be deleted.
+                                 Defaults to 30 minutes.
+
+    Returns: None
+    """
+    cutoff = time.time() - (minutes * 60)
+
+    expired_paths = []
+    with _tracked_audio_files_lock:
+        while _tracked_audio_files and _tracked_audio_files[0][0] < cutoff:
+            expired_paths.append(heapq.heappop(_tracked_audio_files)[1])
+
+    for path in expired_paths:
+        try:
+            Path(path).unlink(missing_ok=True)
+            logger.debug("Deleted: %s", path)
+        except Exception as e:
+            logger.warning("Error deleting %s: %s", path, e)
+
+def _run_audio_cleanup(directory: Path, minutes: int) -> None:
+    """
+    Delete old files in the specified directory.
+
+    The first sweep, and every `_AUDIO_FULL_SWEEP_EVERY`th sweep after it, scans the whole directory (picking up
+    files left over from previous runs or never tracked); the sweeps in between only delete expired tracked files.
+
+    Args:
+        directory (Path): The path to the directory where files will be checked and possibly deleted.
+        minutes (int): The age threshold in minutes.
+
+    Returns: None
+    """
+    global _audio_cleanup_sweeps  # noqa
+
+    if _audio_cleanup_sweeps % _AUDIO_FULL_SWEEP_EVERY == 0:
+        _delete_files_older_than(directory, minutes)
+    else:
+        _delete_tracked_files_older_than(minutes)
+    _audio_cleanup_sweeps += 1
+
+async def delete_old_audio_files_periodically(config: Config) -> None:
+    """
+    Periodically deletes audio files older than 30 minutes from the audio directory, until cancelled.
+
+    Intended to be run as a background task for the lifetime of the app. Each sweep runs in a worker thread, so that
+    neither the event loop nor the audio save path waits on directory scans and unlinks.
+
+    Args:
+        config (Config): Application configuration containing the audio directory.
+
+    Returns: None
+    """
+    while True:
+        try:
+            await asyncio.to_thread(_run_audio_cleanup, config.audio_dir, _AUDIO_FILE_MAX_AGE_MINUTES)
+        except Exception as e:
+            logger.exception(f"Error cleaning up old files in {config.audio_dir}: {e}")
+        await asyncio.sleep(_AUDIO_CLEANUP_INTERVAL_SECONDS)
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Write all of the given bytes to an open file descriptor, retrying on partial writes.
+
+    Args:
+        fd (int): An open, writable file descriptor.
+        data (bytes): The bytes to write.
+
+    Returns: None
+    """
+    view = memoryview(data)
+    while view:
+        bytes_written = os.write(fd, view)
+        view = view[bytes_written:]
+
+def _write_base64_audio_to_file(base64_audio: str, file_path: Path) -> None:
+    """
+    Decode a base64-encoded audio string and write the resulting binary data to the given file.
+
+    The audio is decoded and written in fixed-size chunks so that the fully decoded audio is never held in memory.
+    This performs blocking file I/O and is meant to run in a worker thread.
+
+    Args:
+        base64_audio (str): The base64-encoded string representing the audio data.
+        file_path (Path): The path of the file to write.
+
+    Returns: None
+    """
+    # Write the binary audio data to the file directly, bypassing Python's buffered I/O layer.
+    # The base64 text is encoded once and sliced through a memoryview, so decoding each chunk copies nothing but
+    # the decoded output.
+    encoded_audio = memoryview(base64_audio.encode("ascii"))
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            for start in range(0, len(encoded_audio), _BASE64_DECODE_CHUNK_SIZE):
+                chunk = encoded_audio[start:start + _BASE64_DECODE_CHUNK_SIZE]
+                _write_all(fd, _b64decode(chunk))
+        except binascii.Error:
+            # Chunks only decode independently when the payload has no embedded whitespace (e.g. line wrapping), which
+            # shifts the 4-character quanta across chunk boundaries. Start over and decode the whole payload at once,
+            # which skips whitespace; genuinely invalid base64 still raises here.
+            os.ftruncate(fd, 0)
+            os.lseek(fd, 0, os.SEEK_SET)
+            _write_all(fd, _b64decode(encoded_audio))
+    except BaseException:
+        # Don't leave a partially written (and untracked) file behind
+        os.close(fd)
+        file_path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+
+async def save_base64_audio_to_file(base64_audio: str, filename: str, config: Config) -> str:
     """
     Decode a base64-encoded audio string and write the resulting binary data to a file
-    within the preconfigured AUDIO_DIR directory. Prior to writing the bytes to an audio
-    file, all files within the directory that are more than 30 minutes old are deleted.
-    This function verifies the file was created, logs both the absolute and relative
-    file paths, and returns a path relative to the current working directory
-    (as required by Gradio for serving static files).
+    within the preconfigured AUDIO_DIR directory. The decoding and writing run in a worker
+    thread so that disk I/O does not block the event loop. The file is tracked for deletion by
+    `delete_old_audio_files_periodically` once it is more than 30 minutes old.
+    This function logs both the absolute and relative file paths, and returns a path relative
+    to the current working directory (as required by Gradio for serving static files).
 
     Args:
         base64_audio (str): The base64-encoded string representing the audio data.
@@ -57,36 +233,27 @@ def save_base64_audio_to_file(base64_audio: str, filename: str, config: Config)
 
     Returns:
         str: The relative file path to the saved audio file.
-
-    Raises:
-        FileNotFoundError: If the audio file was not created.
     """
+    file_path = config.audio_dir / filename
 
-    audio_bytes = base64.b64decode(base64_audio)
-    file_path = Path(config.audio_dir) / filename
-    num_minutes = 30
-
-    _delete_files_older_than(config.audio_dir, num_minutes)
-
-    # Write the binary audio data to the file.
-    with file_path.open("wb") as audio_file:
-        audio_file.write(audio_bytes)
-
-    # Verify that the file was created.
-    if not file_path.exists():
-        raise FileNotFoundError(f"Audio file was not created at {file_path}")
+    await asyncio.to_thread(_write_base64_audio_to_file, base64_audio, file_path)
+    track_audio_file(file_path)
 
     # Compute a relative path for Gradio to serve (relative to the current working directory).
-    relative_path = file_path.relative_to(Path.cwd())
-    logger.debug(f"Audio file absolute path: {file_path}")
-    logger.debug(f"Audio file relative path: {relative_path}")
+    relative_path = config.audio_dir_relative / filename
+    logger.debug("Audio file absolute path: %s", file_path)
+    logger.debug("Audio file relative path: %s", relative_path)
 
     return str(relative_path)
 
+@lru_cache(maxsize=None)
 def validate_env_var(var_name: str) -> str:
     """
     Validates that an environment variable is set and returns its value.
 
+    Values are cached per variable name, since environment variables are not expected to change once the app has
+    started; call `validate_env_var.cache_clear()` after modifying the environment if needed.
+
     Args:
         var_name (str): The name of the environment variable to validate.
 
@@ -101,3 +268,50 @@ def validate_env_var(var_name: str) -> str:
         raise ValueError(f"{var_name} is not set. Please ensure it is defined in your environment variables.")
     return value
 
+def _get_retry_after_seconds(exception: Optional[BaseException]) -> Optional[float]:
+    """
+    Extracts the delay requested by an API's `Retry-After` header from a wrapped integration error.
+
+    Integration errors keep the SDK exception in `original_exception`; depending on the SDK, response headers are
+    exposed either on the exception itself or on its `response` attribute. Only the delay-seconds form of the header
+    is supported.
+
+    Args:
+        exception (Optional[BaseException]): The exception raised by the last attempt.
+
+    Returns:
+        Optional[float]: The requested delay in seconds, or None if the header is absent or not parseable.
+    """
+    original_exception = getattr(exception, "original_exception", None)
+    response = getattr(original_exception, "response", None)
+    headers = getattr(response, "headers", None) or getattr(original_exception, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+def wait_for_retry_after(
+    fallback: Callable[[RetryCallState], float],
+    max_wait: float,
+) -> Callable[[RetryCallState], float]:
+    """
+    Builds a tenacity wait strategy that honors the `Retry-After` header of rate-limited API responses.
+
+    Args:
+        fallback (Callable[[RetryCallState], float]): The wait strategy to use when no `Retry-After` is available.
+        max_wait (float): Upper bound in seconds on any delay taken from a `Retry-After` header.
+
+    Returns:
+        Callable[[RetryCallState], float]: A wait strategy to pass as `wait=` to tenacity's `retry`.
+    """
+    def wait(retry_state: RetryCallState) -> float:
+        exception = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = _get_retry_after_seconds(exception)
+        if retry_after is not None:
+            return min(retry_after, max_wait)
+        return fallback(retry_state)
+
+    return wait
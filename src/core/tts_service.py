@@ -1,7 +1,9 @@
 # Standard Library Imports
 import asyncio
+import bisect
+import itertools
 import random
-from typing import Tuple
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 
 # Local Application Imports
 from src.common import Config, Option, OptionMap, TTSProviderName, logger
@@ -12,6 +14,42 @@ from src.integrations import (
     text_to_speech_with_openai,
 )
 
+# Dedicated random number generator for provider selection and option ordering, independent of the global `random`
+# module state. TTS requests are handled on the event loop thread, so a single module-level instance suffices.
+_rng = random.Random()
+
+# Provider pairs for unmodified text, and their selection weights. When modifying the probability distribution, make
+# sure the weights match the order of provider pairs.
+_PROVIDER_PAIRS: Tuple[Tuple[TTSProviderName, TTSProviderName], ...] = (
+    (HUME_AI, OPENAI),
+    (HUME_AI, ELEVENLABS),
+    (OPENAI, ELEVENLABS),
+)
+_PROVIDER_PAIR_WEIGHTS: Tuple[int, ...] = (1, 1, 1)
+# Cumulative weights, precomputed so each selection is a single random draw and a binary search
+_PROVIDER_PAIR_CUM_WEIGHTS: Tuple[int, ...] = tuple(itertools.accumulate(_PROVIDER_PAIR_WEIGHTS))
+
+# Signature shared by the single-generation TTS functions, which take a character description, text, and config, and
+# return a generation ID and audio file path
+TTSProviderFunction = Callable[[str, str, Config], Awaitable[Tuple[Optional[str], str]]]
+
+
+async def _text_to_speech_with_hume_once(character_description: str, text: str, config: Config) -> Tuple[str, str]:
+    """
+    Synthesizes a single Hume generation, returning the same (generation_id, audio_file_path) pair as the other
+    providers' TTS functions.
+
+    Args:
+        character_description (str): Description used for voice synthesis.
+        text (str): Text to be converted to speech.
+        config (Config): Application configuration containing Hume API settings.
+
+    Returns:
+        Tuple[str, str]: The generation ID and the path to the saved audio file.
+    """
+    generation_id, audio_file_path = await text_to_speech_with_hume(character_description, text, config)
+    return generation_id, audio_file_path
+
 
 class TTSService:
     """
@@ -29,8 +67,8 @@ class TTSService:
             config (Config): Application configuration containing API settings
         """
         self.config = config
-        self.tts_provider_functions = {
-            HUME_AI: text_to_speech_with_hume,
+        self.tts_provider_functions: Dict[TTSProviderName, TTSProviderFunction] = {
+            HUME_AI: _text_to_speech_with_hume_once,
             ELEVENLABS: text_to_speech_with_elevenlabs,
             OPENAI: text_to_speech_with_openai,
         }
@@ -55,15 +93,9 @@ class TTSService:
         if text_modified:
             return HUME_AI, HUME_AI
 
-        # When modifying the probability distribution, make sure the weights match the order of provider pairs
-        provider_pairs = [
-            (HUME_AI, OPENAI),
-            (HUME_AI, ELEVENLABS),
-            (OPENAI, ELEVENLABS),
-        ]
-        weights = [1, 1, 1]
-        selected_pair = random.choices(provider_pairs, weights=weights, k=1)[0]
-        return selected_pair
+        total_weight = _PROVIDER_PAIR_CUM_WEIGHTS[-1]
+        selected_index = bisect.bisect(_PROVIDER_PAIR_CUM_WEIGHTS, _rng.random() * total_weight)
+        return _PROVIDER_PAIRS[selected_index]
 
     async def synthesize_speech(
         self,
@@ -87,22 +119,32 @@ class TTSService:
                     its provider, audio file path, and generation ID.
         """
         provider_a, provider_b = self.__select_providers(text_modified)
+        generation_id_a: Optional[str]
+        generation_id_b: Optional[str]
 
         logger.info(f"Starting speech synthesis with providers: {provider_a} and {provider_b}")
 
-        task_a = self.tts_provider_functions[provider_a](character_description, text, self.config)
-        task_b = self.tts_provider_functions[provider_b](character_description, text, self.config)
+        if provider_a == HUME_AI and provider_b == HUME_AI:
+            # Request both Hume generations in a single API call rather than two separate calls
+            generation_id_a, audio_a, generation_id_b, audio_b = await text_to_speech_with_hume(
+                character_description, text, self.config, num_generations=2
+            )
+        else:
+            task_a = self.tts_provider_functions[provider_a](character_description, text, self.config)
+            task_b = self.tts_provider_functions[provider_b](character_description, text, self.config)
 
-        (generation_id_a, audio_a), (generation_id_b, audio_b) = await asyncio.gather(task_a, task_b)
+            (generation_id_a, audio_a), (generation_id_b, audio_b) = await asyncio.gather(task_a, task_b)
 
         logger.info(f"Synthesis succeeded for providers: {provider_a} and {provider_b}")
 
         option_a = Option(provider=provider_a, audio=audio_a, generation_id=generation_id_a)
         option_b = Option(provider=provider_b, audio=audio_b, generation_id=generation_id_b)
 
-        options = [option_a, option_b]
-        random.shuffle(options)
-        shuffled_option_a, shuffled_option_b = options
+        # Randomize the order of the two options with a single random bit
+        if _rng.getrandbits(1):
+            shuffled_option_a, shuffled_option_b = option_b, option_a
+        else:
+            shuffled_option_a, shuffled_option_b = option_a, option_b
 
         return {
             "option_a": {
@@ -1,9 +1,12 @@
 # Standard Library Imports
+import asyncio
 import json
-from typing import List, Tuple
+import logging
+from dataclasses import asdict
+from typing import Dict, FrozenSet, List, Tuple, cast
 
 # Third-Party Library Imports
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 # Local Application Imports
 from src.common import (
@@ -24,6 +27,33 @@ from src.database import (
     get_leaderboard_stats,
 )
 
+# Maps the set of providers in a comparison to its comparison type. A Hume AI - Hume AI comparison is keyed by the
+# single-element set {HUME_AI}.
+_COMPARISON_TYPES: Dict[FrozenSet[TTSProviderName], ComparisonType] = {
+    frozenset({constants.HUME_AI}): constants.HUME_TO_HUME,
+    frozenset({constants.HUME_AI, constants.ELEVENLABS}): constants.HUME_TO_ELEVENLABS,
+    frozenset({constants.HUME_AI, constants.OPENAI}): constants.HUME_TO_OPENAI,
+    frozenset({constants.ELEVENLABS, constants.OPENAI}): constants.OPENAI_TO_ELEVENLABS,
+}
+
+# Templates for leaderboard table cells
+_CENTERED_CELL_TEMPLATE = '<p style="text-align: center;">%s</p>'
+_LINK_CELL_TEMPLATE = '<a href="%s" target="_blank" class="provider-link">%s</a>'
+
+# Static leaderboard HTML fragments that depend only on the provider, rendered once at import
+_PROVIDER_LINK_CELLS: Dict[str, str] = {
+    provider: _LINK_CELL_TEMPLATE % (links["provider_link"], provider)
+    for provider, links in constants.TTS_PROVIDER_LINKS.items()
+}
+_MODEL_LINKS: Dict[str, str] = {
+    provider: links["model_link"] for provider, links in constants.TTS_PROVIDER_LINKS.items()
+}
+_PROVIDER_ROW_HEADER_CELLS: Dict[str, str] = {
+    provider: f'<p style="padding-left: 8px;"><strong>{provider}</strong></p>' for provider in constants.TTS_PROVIDERS
+}
+
+FormattedLeaderboardData = Tuple[List[List[str]], List[List[str]], List[List[str]]]
+
 
 class VotingService:
     """
@@ -40,6 +70,8 @@ class VotingService:
             db_session_maker: An asynchronous database session factory.
         """
         self.db_session_maker: AsyncDBSessionMaker = db_session_maker
+        # Anything other than a real sessionmaker is the dummy session factory used when no database is configured
+        self.is_dummy_db: bool = not isinstance(db_session_maker, async_sessionmaker)
         logger.debug("VotingService initialized.")
 
     async def _create_db_session(self) -> AsyncSession | None:
@@ -49,17 +81,11 @@ class VotingService:
         Returns:
             An active AsyncSession or None if using a dummy session factory.
         """
-        session = self.db_session_maker()
-        # Check for a dummy session marker if your factory provides one
-        is_dummy_session = getattr(session, "is_dummy", False)
-
-        if is_dummy_session:
+        if self.is_dummy_db:
             logger.debug("Using dummy DB session; operations will be skipped.")
-            # Ensure dummy sessions are also closed if they have resources
-            if hasattr(session, "close"):
-                await session.close()
             return None
 
+        session = self.db_session_maker()
         logger.debug("Created new DB session.")
         return session
 
@@ -77,21 +103,10 @@ class VotingService:
         Raises:
             ValueError: If the combination of providers is not recognized.
         """
-        if provider_a == constants.HUME_AI and provider_b == constants.HUME_AI:
-            return constants.HUME_TO_HUME
-
-        providers = (provider_a, provider_b)
-
-        if constants.HUME_AI in providers and constants.ELEVENLABS in providers:
-            return constants.HUME_TO_ELEVENLABS
-
-        if constants.HUME_AI in providers and constants.OPENAI in providers:
-            return constants.HUME_TO_OPENAI
-
-        if constants.ELEVENLABS in providers and constants.OPENAI in providers:
-            return constants.OPENAI_TO_ELEVENLABS
-
-        raise ValueError(f"Invalid provider combination: {provider_a}, {provider_b}")
+        comparison_type = _COMPARISON_TYPES.get(frozenset((provider_a, provider_b)))
+        if comparison_type is None:
+            raise ValueError(f"Invalid provider combination: {provider_a}, {provider_b}")
+        return comparison_type
 
     async def _persist_vote(self, voting_results: VotingResults) -> None:
         """
@@ -100,7 +115,7 @@ class VotingService:
         Handles session creation, commit, rollback, and closure. Logs errors internally.
 
         Args:
-            voting_results: A dictionary containing the vote details.
+            voting_results: The vote details to persist.
         """
         session = await self._create_db_session()
         if session is None:
@@ -119,9 +134,11 @@ class VotingService:
             logger.debug("DB session closed after persisting vote.")
 
     def _log_voting_results(self, voting_results: VotingResults) -> None:
-        """Logs the full voting results dictionary."""
+        """Logs the full voting results."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         try:
-            logger.info("Voting results:\n%s", json.dumps(voting_results, indent=4, default=str))
+            logger.info("Voting results:\n%s", json.dumps(asdict(voting_results), indent=4, default=str))
         except TypeError:
             logger.error("Could not serialize voting results for logging.")
             logger.info(f"Voting results (raw): {voting_results}")
@@ -130,16 +147,17 @@ class VotingService:
         """Formats raw leaderboard entries into HTML strings for the UI table."""
         formatted_data = []
         for rank, provider, model, win_rate, votes in leaderboard_data_raw:
-            provider_info = constants.TTS_PROVIDER_LINKS.get(provider, {})
-            provider_link = provider_info.get("provider_link", "#")
-            model_link = provider_info.get("model_link", "#")
+            provider_cell = _PROVIDER_LINK_CELLS.get(provider)
+            if provider_cell is None:
+                provider_cell = _LINK_CELL_TEMPLATE % ("#", provider)
+            model_link = _MODEL_LINKS.get(provider, "#")
 
             formatted_data.append([
-                f'<p style="text-align: center;">{rank}</p>',
-                f'<a href="{provider_link}" target="_blank" class="provider-link">{provider}</a>',
-                f'<a href="{model_link}" target="_blank" class="provider-link">{model}</a>',
-                f'<p style="text-align: center;">{win_rate}</p>',
-                f'<p style="text-align: center;">{votes}</p>',
+                _CENTERED_CELL_TEMPLATE % rank,
+                provider_cell,
+                _LINK_CELL_TEMPLATE % (model_link, model),
+                _CENTERED_CELL_TEMPLATE % win_rate,
+                _CENTERED_CELL_TEMPLATE % votes,
             ])
         return formatted_data
 
@@ -151,14 +169,14 @@ class VotingService:
 
         formatted_matrix: List[List[str]] = []
         for row_provider in providers:
-            row = [f'<p style="padding-left: 8px;"><strong>{row_provider}</strong></p>']
+            row = [_PROVIDER_ROW_HEADER_CELLS[row_provider]]
             for col_provider in providers:
                 if row_provider == col_provider:
                     cell_value = "-"
                 else:
                     comparison_key = self._determine_comparison_type(row_provider, col_provider)
                     cell_value = battle_counts_dict.get(comparison_key, "0")
-                row.append(f'<p style="text-align: center;">{cell_value}</p>')
+                row.append(_CENTERED_CELL_TEMPLATE % cell_value)
             formatted_matrix.append(row)
         return formatted_matrix
 
@@ -169,29 +187,24 @@ class VotingService:
         win_rates = {}
         for comparison_type, first_win_rate, second_win_rate in win_rate_data_raw:
             # Comparison type should already be canonical 'ProviderA - ProviderB'
-            try:
-                provider1, provider2 = comparison_type.split(" - ")
-                win_rates[(provider1, provider2)] = first_win_rate
-                win_rates[(provider2, provider1)] = second_win_rate
-            except ValueError:
+            provider1, separator, provider2 = comparison_type.partition(" - ")
+            if not separator or " - " in provider2:
                 logger.warning(f"Could not parse comparison_type '{comparison_type}' in win rate data.")
                 continue # Skip malformed entry
+            win_rates[(provider1, provider2)] = first_win_rate
+            win_rates[(provider2, provider1)] = second_win_rate
 
         providers = constants.TTS_PROVIDERS
         formatted_matrix: List[List[str]] = []
         for row_provider in providers:
-            row = [f'<p style="padding-left: 8px;"><strong>{row_provider}</strong></p>']
+            row = [_PROVIDER_ROW_HEADER_CELLS[row_provider]]
             for col_provider in providers:
                 cell_value = "-" if row_provider == col_provider else win_rates.get((row_provider, col_provider), "0%")
-                row.append(f'<p style="text-align: center;">{cell_value}</p>')
+                row.append(_CENTERED_CELL_TEMPLATE % cell_value)
             formatted_matrix.append(row)
         return formatted_matrix
 
-    async def get_formatted_leaderboard_data(self) -> Tuple[
-        List[List[str]],
-        List[List[str]],
-        List[List[str]],
-    ]:
+    async def get_formatted_leaderboard_data(self) -> FormattedLeaderboardData:
         """
         Fetches raw leaderboard stats and formats them for UI display.
 
@@ -205,16 +218,22 @@ class VotingService:
             - Win rate matrix
             Returns empty lists ([[]], [[]], [[]]) on failure.
         """
-        session = await self._create_db_session()
-        if session is None:
+        if self.is_dummy_db:
             logger.info("Skipping leaderboard fetch (dummy session).")
             return [[]], [[]], [[]]
 
+        # AsyncSession does not support concurrent operations, so each query gets its own session (and pool connection)
+        session_maker = cast(async_sessionmaker[AsyncSession], self.db_session_maker)
+        sessions: List[AsyncSession] = [session_maker() for _ in range(3)]
+
+        leaderboard_session, battle_counts_session, win_rate_session = sessions
         try:
-            # Fetch raw data using underlying CRUD functions
-            leaderboard_data_raw = await get_leaderboard_stats(session)
-            battle_counts_data_raw = await get_head_to_head_battle_stats(session)
-            win_rate_data_raw = await get_head_to_head_win_rate_stats(session)
+            # Fetch raw data concurrently using underlying CRUD functions
+            leaderboard_data_raw, battle_counts_data_raw, win_rate_data_raw = await asyncio.gather(
+                get_leaderboard_stats(leaderboard_session),
+                get_head_to_head_battle_stats(battle_counts_session),
+                get_head_to_head_win_rate_stats(win_rate_session),
+            )
             logger.debug("Fetched raw leaderboard data successfully.")
 
             # Format the data
@@ -228,8 +247,8 @@ class VotingService:
             logger.error(f"Failed to fetch and format leaderboard data: {e}", exc_info=True)
             return [[]], [[]], [[]] # Return empty structure on error
         finally:
-            await session.close()
-            logger.debug("DB session closed after fetching leaderboard data.")
+            await asyncio.gather(*(session.close() for session in sessions))
+            logger.debug("DB sessions closed after fetching leaderboard data.")
 
     async def submit_vote(
         self,
@@ -257,18 +276,18 @@ class VotingService:
 
             comparison_type: ComparisonType = self._determine_comparison_type(provider_a, provider_b)
 
-            voting_results: VotingResults = {
-                "comparison_type": comparison_type,
-                "winning_provider": option_map[selected_option]["provider"],
-                "winning_option": selected_option,
-                "option_a_provider": provider_a,
-                "option_b_provider": provider_b,
-                "option_a_generation_id": option_map[constants.OPTION_A_KEY]["generation_id"],
-                "option_b_generation_id": option_map[constants.OPTION_B_KEY]["generation_id"],
-                "character_description": character_description,
-                "text": text,
-                "is_custom_text": text_modified,
-            }
+            voting_results = VotingResults(
+                comparison_type=comparison_type,
+                winning_provider=option_map[selected_option]["provider"],
+                winning_option=selected_option,
+                option_a_provider=provider_a,
+                option_b_provider=provider_b,
+                option_a_generation_id=option_map[constants.OPTION_A_KEY]["generation_id"],
+                option_b_generation_id=option_map[constants.OPTION_B_KEY]["generation_id"],
+                character_description=character_description,
+                text=text,
+                is_custom_text=text_modified,
+            )
 
             await self._persist_vote(voting_results)
 
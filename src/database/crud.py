@@ -26,16 +26,16 @@ async def create_vote(db: AsyncSession, vote_data: VotingResults) -> VoteResult:
     try:
         # Create vote record
         vote = VoteResult(
-            comparison_type=vote_data["comparison_type"],
-            winning_provider=vote_data["winning_provider"],
-            winning_option=vote_data["winning_option"],
-            option_a_provider=vote_data["option_a_provider"],
-            option_b_provider=vote_data["option_b_provider"],
-            option_a_generation_id=vote_data["option_a_generation_id"],
-            option_b_generation_id=vote_data["option_b_generation_id"],
-            voice_description=vote_data["character_description"],
-            text=vote_data["text"],
-            is_custom_text=vote_data["is_custom_text"],
+            comparison_type=vote_data.comparison_type,
+            winning_provider=vote_data.winning_provider,
+            winning_option=vote_data.winning_option,
+            option_a_provider=vote_data.option_a_provider,
+            option_b_provider=vote_data.option_b_provider,
+            option_a_generation_id=vote_data.option_a_generation_id,
+            option_b_generation_id=vote_data.option_b_generation_id,
+            voice_description=vote_data.character_description,
+            text=vote_data.text,
+            is_custom_text=vote_data.is_custom_text,
         )
 
         db.add(vote)
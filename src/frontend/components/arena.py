@@ -2,7 +2,7 @@
 import asyncio
 import random
 import time
-from typing import Tuple, Union
+from typing import Callable, Tuple, Union
 
 # Third-Party Library Imports
 import gradio as gr
@@ -61,6 +61,47 @@ SAMPLE_CHARACTER_DESCRIPTIONS: dict = {
     ),
 }
 
+def _make_length_validator(min_length: int, max_length: int, input_name: str) -> Callable[[str], None]:
+    """
+    Builds a validator that checks an input string's length against minimum and maximum limits.
+
+    The limits are bound once and the constant portions of the error messages are precomputed, so each call only
+    measures the input and, on failure, appends its length.
+
+    Args:
+        min_length: The minimum required length (inclusive).
+        max_length: The maximum allowed length (inclusive).
+        input_name: A descriptive name of the input field (e.g., "character description")
+                    used for error messages.
+
+    Returns:
+        A function that validates an input string, raising ValueError if its length is outside the bounds.
+    """
+    too_short_message = f"Your {input_name} is too short. Please enter at least {min_length} characters."
+    too_long_message = f"Your {input_name} is too long. Please limit it to {max_length} characters."
+
+    def validate_input_length(input_value: str) -> None:
+        value_length = len(input_value.strip())
+        logger.debug("Validating length for '%s': %d characters", input_name, value_length)
+
+        if value_length < min_length:
+            raise ValueError(f"{too_short_message} (Current length: {value_length})")
+        if value_length > max_length:
+            raise ValueError(f"{too_long_message} (Current length: {value_length})")
+
+    return validate_input_length
+
+_validate_character_description_length = _make_length_validator(
+    constants.CHARACTER_DESCRIPTION_MIN_LENGTH,
+    constants.CHARACTER_DESCRIPTION_MAX_LENGTH,
+    "character description",
+)
+_validate_text_length = _make_length_validator(
+    constants.TEXT_MIN_LENGTH,
+    constants.TEXT_MAX_LENGTH,
+    "text",
+)
+
 class Arena:
     """
     Handles the user interface logic, state management, and event handling
@@ -79,75 +120,6 @@ class Arena:
         self.tts_service = tts_service
         self.voting_service = voting_service
 
-    def _validate_input_length(
-        self,
-        input_value: str,
-        min_length: int,
-        max_length: int,
-        input_name: str,
-    ) -> None:
-        """
-        Validates input string length against minimum and maximum limits.
-
-        Args:
-            input_value: The string value to validate.
-            min_length: The minimum required length (inclusive).
-            max_length: The maximum allowed length (inclusive).
-            input_name: A descriptive name of the input field (e.g., "character description")
-                        used for error messages.
-
-        Raises:
-            ValueError: If the input length is outside the specified bounds.
-        """
-        stripped_value = input_value.strip()
-        value_length = len(stripped_value)
-        logger.debug(f"Validating length for '{input_name}': {value_length} characters")
-
-        if value_length < min_length:
-            raise ValueError(
-                f"Your {input_name} is too short. Please enter at least "
-                f"{min_length} characters. (Current length: {value_length})"
-            )
-        if value_length > max_length:
-            raise ValueError(
-                f"Your {input_name} is too long. Please limit it to "
-                f"{max_length} characters. (Current length: {value_length})"
-            )
-
-    def _validate_character_description_length(self, character_description: str) -> None:
-        """
-        Validates the character description length using predefined constants.
-
-        Args:
-            character_description: The input character description to validate.
-
-        Raises:
-            ValueError: If the character description length is invalid.
-        """
-        self._validate_input_length(
-            character_description,
-            constants.CHARACTER_DESCRIPTION_MIN_LENGTH,
-            constants.CHARACTER_DESCRIPTION_MAX_LENGTH,
-            "character description",
-        )
-
-    def _validate_text_length(self, text: str) -> None:
-        """
-        Validates the input text length using predefined constants.
-
-        Args:
-            text: The input text to validate.
-
-        Raises:
-            ValueError: If the text length is invalid.
-        """
-        self._validate_input_length(
-            text,
-            constants.TEXT_MIN_LENGTH,
-            constants.TEXT_MAX_LENGTH,
-            "text",
-        )
-
     async def _generate_text(self, character_description: str) -> Tuple[dict, str]:
         """
         Validates the character description and generates text using the Anthropic API.
@@ -164,7 +136,7 @@ class Arena:
             gr.Error: On validation failure or Anthropic API errors.
         """
         try:
-            self._validate_character_description_length(character_description)
+            _validate_character_description_length(character_description)
         except ValueError as ve:
             logger.warning(f"Validation error: {ve}")
             raise gr.Error(str(ve))
@@ -223,8 +195,8 @@ class Arena:
             gr.Error: On validation failure or errors during TTS synthesis API calls.
         """
         try:
-            self._validate_character_description_length(character_description)
-            self._validate_text_length(text)
+            _validate_character_description_length(character_description)
+            _validate_text_length(text)
         except ValueError as ve:
             logger.error(f"Validation error during speech synthesis: {ve}")
             raise gr.Error(str(ve))
@@ -449,7 +421,7 @@ class Arena:
             for relevant buttons, dropdowns, and textboxes. Vote buttons'
             interactivity depends on the input argument.
         """
-        logger.debug(f"Enabling UI components. Enable vote buttons: {should_enable_vote_buttons}")
+        logger.debug("Enabling UI components. Enable vote buttons: %s", should_enable_vote_buttons)
         return(
             gr.update(interactive=True), # enable Randomize All button
             gr.update(interactive=True), # enable Character Description dropdown
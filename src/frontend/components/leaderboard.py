@@ -54,7 +54,7 @@ class Leaderboard:
 
         # Skip update if throttled and not forced
         if not force and time_since_last_update < self.min_refresh_interval:
-            logger.debug(f"Skipping leaderboard update (throttled): last updated {time_since_last_update:.1f}s ago.")
+            logger.debug("Skipping leaderboard update (throttled): last updated %.1fs ago.", time_since_last_update)
             return False
 
         try:
@@ -3,9 +3,11 @@ import logging
 import random
 import time
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, Tuple
 
 # Third-Party Library Imports
+import httpx
 from elevenlabs import AsyncElevenLabs, TextToVoiceCreatePreviewsRequestOutputFormat
 from elevenlabs.core import ApiError
 from tenacity import after_log, before_log, retry, retry_if_exception, stop_after_attempt, wait_fixed
@@ -21,6 +23,9 @@ class ElevenLabsConfig:
 
     api_key: str = field(init=False)
     output_format: TextToVoiceCreatePreviewsRequestOutputFormat = "mp3_44100_128"
+    request_timeout: float = 60.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 50
 
     def __post_init__(self):
         # Validate required attributes.
@@ -30,15 +35,42 @@ class ElevenLabsConfig:
         computed_key = validate_env_var("ELEVENLABS_API_KEY")
         object.__setattr__(self, "api_key", computed_key)
 
-    @property
+    @cached_property
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        Lazy initialization of the HTTP client (and connection pool) shared by all ElevenLabs API requests.
+
+        Returns:
+            httpx.AsyncClient: Configured async HTTP client instance.
+        """
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ),
+            follow_redirects=True,
+        )
+
+    @cached_property
     def client(self) -> AsyncElevenLabs:
         """
-        Lazy initialization of the asynchronous ElevenLabs client.
+        Lazy initialization of the asynchronous ElevenLabs client, reused across requests.
 
         Returns:
             AsyncElevenLabs: Configured async client instance.
         """
-        return AsyncElevenLabs(api_key=self.api_key)
+        return AsyncElevenLabs(
+            api_key=self.api_key,
+            timeout=self.request_timeout,
+            httpx_client=self.http_client,
+        )
+
+    async def aclose(self) -> None:
+        """Closes the shared HTTP client and its connection pool, if it was ever created."""
+        self.__dict__.pop("client", None)
+        http_client = self.__dict__.pop("http_client", None)
+        if http_client is not None:
+            await http_client.aclose()
 
 class ElevenLabsError(Exception):
     """Custom exception for errors related to the ElevenLabs TTS API."""
@@ -83,7 +115,7 @@ async def text_to_speech_with_elevenlabs(
     Raises:
         ElevenLabsError: If there is an error communicating with the ElevenLabs API or processing the response.
     """
-    logger.debug(f"Synthesizing speech with ElevenLabs. Text length: {len(text)} characters.")
+    logger.debug("Synthesizing speech with ElevenLabs. Text length: %d characters.", len(text))
     elevenlabs_config = config.elevenlabs_config
     client = elevenlabs_config.client
     start_time = time.time()
@@ -105,7 +137,7 @@ async def text_to_speech_with_elevenlabs(
         generated_voice_id = preview.generated_voice_id
         base64_audio = preview.audio_base_64
         filename = f"{generated_voice_id}.mp3"
-        audio_file_path = save_base64_audio_to_file(base64_audio, filename, config)
+        audio_file_path = await save_base64_audio_to_file(base64_audio, filename, config)
 
         return None, audio_file_path
 
@@ -1,17 +1,21 @@
 # Standard Library Imports
+import asyncio
+import itertools
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Tuple, Union
+from functools import cached_property
+from typing import Dict, Tuple, Union
 
 # Third-Party Library Imports
+import httpx
 from hume import AsyncHumeClient
 from hume.core.api_error import ApiError
-from hume.tts.types import Format, FormatMp3, PostedUtterance, ReturnTts
-from tenacity import after_log, before_log, retry, retry_if_exception, stop_after_attempt, wait_fixed
+from hume.tts.types import Format, FormatMp3, PostedUtterance, ReturnGeneration, ReturnTts
+from tenacity import after_log, before_log, retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 # Local Application Imports
-from src.common import Config, logger, save_base64_audio_to_file, validate_env_var
+from src.common import Config, logger, save_base64_audio_to_file, validate_env_var, wait_for_retry_after
 from src.common.constants import CLIENT_ERROR_CODE, GENERIC_API_ERROR_MESSAGE, RATE_LIMIT_ERROR_CODE, SERVER_ERROR_CODE
 
 
@@ -22,6 +26,8 @@ class HumeConfig:
     api_key: str = field(init=False)
     file_format: Format = field(default_factory=FormatMp3)
     request_timeout: float = 40.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 50
 
     def __post_init__(self) -> None:
         """Validate required attributes and set computed fields."""
@@ -31,19 +37,43 @@ class HumeConfig:
         computed_api_key = validate_env_var("HUME_API_KEY")
         object.__setattr__(self, "api_key", computed_api_key)
 
-    @property
+    @cached_property
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        Lazy initialization of the HTTP client (and connection pool) shared by all Hume API requests.
+
+        Returns:
+            httpx.AsyncClient: Configured async HTTP client instance.
+        """
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ),
+            follow_redirects=True,
+        )
+
+    @cached_property
     def client(self) -> AsyncHumeClient:
         """
-        Lazy initialization of the asynchronous Hume client.
+        Lazy initialization of the asynchronous Hume client, reused across requests.
 
         Returns:
             AsyncHumeClient: Configured async client instance.
         """
         return AsyncHumeClient(
             api_key=self.api_key,
-            timeout=self.request_timeout
+            timeout=self.request_timeout,
+            httpx_client=self.http_client,
         )
 
+    async def aclose(self) -> None:
+        """Closes the shared HTTP client and its connection pool, if it was ever created."""
+        self.__dict__.pop("client", None)
+        http_client = self.__dict__.pop("http_client", None)
+        if http_client is not None:
+            await http_client.aclose()
+
 class HumeError(Exception):
     """Custom exception for errors related to the Hume TTS API."""
 
@@ -60,41 +90,96 @@ class UnretryableHumeError(HumeError):
         self.original_exception = original_exception
         self.message = message
 
+# Maps (character_description, text, num_generations) to the task running an in-flight Hume TTS request, so that
+# concurrent identical requests share a single API call. Entries are removed as soon as the request completes.
+_inflight_requests: Dict[Tuple[str, str, int], "asyncio.Task[Tuple[str, ...]]"] = {}
+
+async def text_to_speech_with_hume(
+    character_description: str,
+    text: str,
+    config: Config,
+    num_generations: int = 1,
+) -> Tuple[str, ...]:
+    """
+    Synthesizes speech using the Hume TTS API, coalescing concurrent requests with identical inputs.
+
+    If a request with the same character description, text, and number of generations is already in flight, this
+    awaits its result (sharing the same audio files) instead of issuing a second API call. The request runs in its
+    own task, so cancelling one caller doesn't cancel it for the others.
+
+    Args:
+        character_description (str): Description used for voice synthesis.
+        text (str): Text to be converted to speech.
+        config (Config): Application configuration containing Hume API settings.
+        num_generations (int): Number of generations to request from the Hume API. Defaults to 1.
+
+    Returns:
+        Tuple[str, ...]: A flat tuple of (generation_id, audio_file_path) pairs, one per generation.
+
+    Raises:
+        HumeError: For errors communicating with the Hume API.
+        UnretryableHumeError: For client-side HTTP errors (status code 4xx) or an invalid `num_generations`.
+    """
+    request_key = (character_description, text, num_generations)
+
+    inflight = _inflight_requests.get(request_key)
+    if inflight is not None:
+        logger.debug("Awaiting in-flight Hume TTS request with identical inputs.")
+        return await asyncio.shield(inflight)
+
+    task = asyncio.ensure_future(_synthesize_speech_with_hume(character_description, text, config, num_generations))
+    _inflight_requests[request_key] = task
+
+    def _forget_request(finished_task: "asyncio.Task[Tuple[str, ...]]") -> None:
+        if _inflight_requests.get(request_key) is finished_task:
+            del _inflight_requests[request_key]
+        # Mark any exception as retrieved, in case every caller was cancelled before it was raised
+        if not finished_task.cancelled():
+            finished_task.exception()
+
+    task.add_done_callback(_forget_request)
+    return await asyncio.shield(task)
+
 @retry(
     retry=retry_if_exception(lambda e: not isinstance(e, UnretryableHumeError)),
     stop=stop_after_attempt(2),
-    wait=wait_fixed(2),
+    wait=wait_for_retry_after(wait_exponential_jitter(initial=1, max=8, jitter=2), max_wait=8),
     before=before_log(logger, logging.DEBUG),
     after=after_log(logger, logging.DEBUG),
     reraise=True,
 )
-async def text_to_speech_with_hume(
+async def _synthesize_speech_with_hume(
     character_description: str,
     text: str,
     config: Config,
-) -> Tuple[str, str]:
+    num_generations: int = 1,
+) -> Tuple[str, ...]:
     """
     Asynchronously synthesizes speech using the Hume TTS API, processes audio data, and writes audio to a file.
 
     This function uses the Hume Python SDK to send a request to the Hume TTS API with a character description
-    and text to be converted to speech. It extracts the base64-encoded audio and generation ID from the response,
-    saves the audio as an MP3 file, and returns the relevant details.
+    and text to be converted to speech. It extracts the base64-encoded audio and generation ID from each of the
+    requested generations, saves the audio as MP3 files, and returns the relevant details.
 
     Args:
         character_description (str): Description used for voice synthesis.
         text (str): Text to be converted to speech.
         config (Config): Application configuration containing Hume API settings.
+        num_generations (int): Number of generations to request from the Hume API. Defaults to 1.
 
     Returns:
-        Tuple[str, str]: A tuple containing:
+        Tuple[str, ...]: A flat tuple containing, for each generation in order:
             - generation_id (str): Unique identifier for the generated audio.
             - audio_file_path (str): Path to the saved audio file.
 
     Raises:
         HumeError: For errors communicating with the Hume API.
-        UnretryableHumeError: For client-side HTTP errors (status code 4xx).
+        UnretryableHumeError: For client-side HTTP errors (status code 4xx) or an invalid `num_generations`.
     """
-    logger.debug(f"Synthesizing speech with Hume. Text length: {len(text)} characters.")
+    if num_generations < 1:
+        raise UnretryableHumeError(f"Invalid number of generations requested: {num_generations}")
+
+    logger.debug("Synthesizing speech with Hume. Text length: %d characters.", len(text))
     hume_config = config.hume_config
     client = hume_config.client
     start_time = time.time()
@@ -103,6 +188,7 @@ async def text_to_speech_with_hume(
         response: ReturnTts = await client.tts.synthesize_json(
             utterances=[utterance],
             format=hume_config.file_format,
+            num_generations=num_generations,
         )
 
         elapsed_time = time.time() - start_time
@@ -111,14 +197,13 @@ async def text_to_speech_with_hume(
         generations = response.generations
         if not generations:
             raise HumeError("No generations returned by Hume API.")
+        if len(generations) < num_generations:
+            raise HumeError(f"Expected {num_generations} generations from Hume API, received {len(generations)}.")
 
-        generation = generations[0]
-        generation_id = generation.generation_id
-        base64_audio = generation.audio
-        filename = f"{generation_id}.mp3"
-        audio_file_path = save_base64_audio_to_file(base64_audio, filename, config)
-
-        return generation_id, audio_file_path
+        parts = await asyncio.gather(
+            *(_parse_hume_tts_generation(generation, config) for generation in generations[:num_generations])
+        )
+        return tuple(itertools.chain.from_iterable(parts))
 
     except ApiError as e:
         elapsed_time = time.time() - start_time
@@ -143,6 +228,22 @@ async def text_to_speech_with_hume(
 
         raise HumeError(message=clean_message, original_exception=e) from e
 
+async def _parse_hume_tts_generation(generation: ReturnGeneration, config: Config) -> Tuple[str, str]:
+    """
+    Extracts the generation ID from a Hume TTS generation and writes its audio to a file.
+
+    Args:
+        generation (ReturnGeneration): A single generation from the Hume TTS API response.
+        config (Config): Application configuration containing the audio directory.
+
+    Returns:
+        Tuple[str, str]: A tuple containing the generation ID and the path to the saved audio file.
+    """
+    generation_id = generation.generation_id
+    filename = f"{generation_id}.mp3"
+    audio_file_path = await save_base64_audio_to_file(generation.audio, filename, config)
+    return generation_id, audio_file_path
+
 def __extract_hume_api_error_message(e: ApiError) -> str:
     """
     Extracts a clean, user-friendly error message from a Hume API error response.
@@ -1,20 +1,28 @@
 # Standard Library Imports
+import asyncio
 import logging
 import random
-import time
+import uuid
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Literal, Tuple, Union
+from functools import cached_property
+from typing import Dict, Literal, Tuple, Union
 
 # Third-Party Library Imports
-from openai import APIError, AsyncOpenAI
-from tenacity import after_log, before_log, retry, retry_if_exception, stop_after_attempt, wait_fixed
+import httpx
+from openai import APIError, AsyncOpenAI, DefaultAsyncHttpxClient
+from tenacity import after_log, before_log, retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 # Local Application Imports
-from src.common import Config, logger
+from src.common import Config, logger, track_audio_file, wait_for_retry_after
 from src.common.constants import CLIENT_ERROR_CODE, GENERIC_API_ERROR_MESSAGE, RATE_LIMIT_ERROR_CODE, SERVER_ERROR_CODE
 from src.common.utils import validate_env_var
 
+# OpenAI's Python SDK doesn't export a type for their base voice names, so we use a hardcoded tuple of the
+# available voice options.
+OPENAI_BASE_VOICES: Tuple[str, ...] = ("alloy", "ash", "coral", "echo", "fable", "onyx", "nova", "sage", "shimmer")
+
+# Dedicated random number generator for voice selection, independent of the global `random` module state
+_voice_rng = random.Random()
 
 @dataclass(frozen=True)
 class OpenAIConfig:
@@ -23,6 +31,10 @@ class OpenAIConfig:
     api_key: str = field(init=False)
     model: str = "gpt-4o-mini-tts"
     response_format: Literal['mp3', 'opus', 'aac', 'flac', 'wav', 'pcm'] = "mp3"
+    max_connections: int = 1000
+    max_keepalive_connections: int = 200
+    keepalive_expiry: float = 30.0
+    audio_write_chunk_size: int = 256 * 1024
 
     def __post_init__(self) -> None:
         """Validate required attributes and set computed fields."""
@@ -30,29 +42,43 @@ class OpenAIConfig:
         computed_api_key = validate_env_var("OPENAI_API_KEY")
         object.__setattr__(self, "api_key", computed_api_key)
 
-    @property
+    @cached_property
     def client(self) -> AsyncOpenAI:
         """
         Lazy initialization of the asynchronous OpenAI client.
 
+        The client is created once and reused across requests so that its connection pool (and the
+        keep-alive connections within it) is shared, rather than paying a new TCP/TLS handshake per request.
+
         Returns:
             AsyncOpenAI: Configured async client instance.
         """
-        return AsyncOpenAI(api_key=self.api_key)
+        http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            )
+        )
+        # Retries (with backoff that honors Retry-After) are handled by tenacity in `_synthesize_speech_with_openai`,
+        # so the SDK's own retry layer is disabled to keep the two from multiplying.
+        return AsyncOpenAI(api_key=self.api_key, http_client=http_client, max_retries=0)
+
+    async def aclose(self) -> None:
+        """Closes the cached OpenAI client and its connection pool, if the client was ever created."""
+        client = self.__dict__.pop("client", None)
+        if client is not None:
+            await client.close()
 
     @staticmethod
     def select_random_base_voice() -> str:
         """
         Randomly selects one of OpenAI's base voice options for TTS.
 
-        OpenAI's Python SDK doesn't export a type for their base voice names,
-        so we use a hardcoded list of the available voice options.
-
         Returns:
             str: A randomly selected OpenAI base voice name (e.g., 'alloy', 'nova', etc.)
         """
-        openai_base_voices = ["alloy", "ash", "coral", "echo", "fable", "onyx", "nova", "sage", "shimmer"]
-        return random.choice(openai_base_voices)
+        return _voice_rng.choice(OPENAI_BASE_VOICES)
 
 class OpenAIError(Exception):
     """Custom exception for errors related to the OpenAI TTS API."""
@@ -70,15 +96,65 @@ class UnretryableOpenAIError(OpenAIError):
         self.original_exception = original_exception
         self.message = message
 
+# Maps (character_description, text) to the task running an in-flight OpenAI TTS request, so that concurrent
+# identical requests share a single API call. Entries are removed as soon as the request completes.
+_inflight_requests: Dict[Tuple[str, str], "asyncio.Task[Tuple[None, str]]"] = {}
+
+async def text_to_speech_with_openai(
+    character_description: str,
+    text: str,
+    config: Config,
+) -> Tuple[None, str]:
+    """
+    Synthesizes speech using the OpenAI TTS API, coalescing concurrent requests with identical inputs.
+
+    If a request with the same character description and text is already in flight, this awaits its result
+    (sharing the same audio file) instead of issuing a second API call. The request runs in its own task, so
+    cancelling one caller doesn't cancel it for the others.
+
+    Args:
+        character_description (str): Description used for voice synthesis.
+        text (str): Text to be converted to speech.
+        config (Config): Application configuration containing OpenAI API settings.
+
+    Returns:
+        Tuple[None, str]: A tuple containing:
+            - generation_id (None): OpenAI does not return a generation ID.
+            - audio_file_path (str): Path to the saved audio file.
+
+    Raises:
+        OpenAIError: For errors communicating with the OpenAI API.
+        UnretryableOpenAIError: For client-side HTTP errors (status code 4xx).
+    """
+    request_key = (character_description, text)
+
+    inflight = _inflight_requests.get(request_key)
+    if inflight is not None:
+        logger.debug("Awaiting in-flight OpenAI TTS request with identical inputs.")
+        return await asyncio.shield(inflight)
+
+    task = asyncio.ensure_future(_synthesize_speech_with_openai(character_description, text, config))
+    _inflight_requests[request_key] = task
+
+    def _forget_request(finished_task: "asyncio.Task[Tuple[None, str]]") -> None:
+        if _inflight_requests.get(request_key) is finished_task:
+            del _inflight_requests[request_key]
+        # Mark any exception as retrieved, in case every caller was cancelled before it was raised
+        if not finished_task.cancelled():
+            finished_task.exception()
+
+    task.add_done_callback(_forget_request)
+    return await asyncio.shield(task)
+
 @retry(
     retry=retry_if_exception(lambda e: not isinstance(e, UnretryableOpenAIError)),
-    stop=stop_after_attempt(2),
-    wait=wait_fixed(2),
+    stop=stop_after_attempt(5),
+    wait=wait_for_retry_after(wait_random_exponential(multiplier=0.5, max=8), max_wait=8),
     before=before_log(logger, logging.DEBUG),
     after=after_log(logger, logging.DEBUG),
     reraise=True,
 )
-async def text_to_speech_with_openai(
+async def _synthesize_speech_with_openai(
     character_description: str,
     text: str,
     config: Config,
@@ -104,10 +180,11 @@ async def text_to_speech_with_openai(
         OpenAIError: For errors communicating with the OpenAI API.
         UnretryableOpenAIError: For client-side HTTP errors (status code 4xx).
     """
-    logger.debug(f"Synthesizing speech with OpenAI. Text length: {len(text)} characters.")
+    logger.debug("Synthesizing speech with OpenAI. Text length: %d characters.", len(text))
     openai_config = config.openai_config
     client = openai_config.client
-    start_time = time.time()
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
     try:
         voice = openai_config.select_random_base_voice()
         async with client.audio.speech.with_streaming_response.create(
@@ -117,18 +194,27 @@ async def text_to_speech_with_openai(
             response_format=openai_config.response_format,
             voice=voice, # OpenAI requires a base voice to be specified
         ) as response:
-            elapsed_time = time.time() - start_time
+            elapsed_time = loop.time() - start_time
             logger.info(f"OpenAI API request completed in {elapsed_time:.2f} seconds.")
 
-            filename = f"openai_{voice}_{start_time}"
-            audio_file_path = Path(config.audio_dir) / filename
-            await response.stream_to_file(audio_file_path)
-            relative_audio_file_path = audio_file_path.relative_to(Path.cwd())
+            filename = f"openai_{voice}_{uuid.uuid4().hex}.{openai_config.response_format}"
+            audio_file_path = config.audio_dir / filename
+            # Buffer the response into large fixed-size chunks so each (thread-offloaded) file write handles a full
+            # chunk rather than however many bytes the network happened to deliver. The chunk size is large enough
+            # that a typical TTS clip is written with a single write.
+            try:
+                await response.stream_to_file(audio_file_path, chunk_size=openai_config.audio_write_chunk_size)
+            except BaseException:
+                # Don't leave a partially written (and untracked) file behind, e.g. before a retry
+                audio_file_path.unlink(missing_ok=True)
+                raise
+            track_audio_file(audio_file_path)
+            relative_audio_file_path = config.audio_dir_relative / filename
 
             return None, str(relative_audio_file_path)
 
     except APIError as e:
-        elapsed_time = time.time() - start_time
+        elapsed_time = loop.time() - start_time
         logger.error(f"OpenAI API request failed after {elapsed_time:.2f} seconds: {e!s}")
         logger.error(f"Full OpenAI API error: {e!s}")
         clean_message = __extract_openai_error_message(e)
@@ -1,19 +1,40 @@
 # Standard Library Imports
 import asyncio
 from pathlib import Path
+from typing import Any
 
 # Third-Party Library Imports
 import gradio as gr
+import uvicorn
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
+from starlette.responses import Response
 
 # Local Application Imports
-from src.common import Config, logger
+from src.common import Config, delete_old_audio_files_periodically, logger
 from src.database import init_db
 from src.frontend import Frontend
 from src.middleware import MetaTagInjectionMiddleware
 
 
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that lets clients and crawlers cache served assets.
+
+    Starlette already handles ETag/Last-Modified validation (304 responses); this adds a Cache-Control header
+    so repeat fetches (e.g. of the OpenGraph image on share-link crawls) can skip the request entirely.
+    """
+
+    def __init__(self, *args: Any, max_age: int = 86400, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.cache_control = f"public, max-age={max_age}"
+
+    def file_response(self, *args: Any, **kwargs: Any) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("cache-control", self.cache_control)
+        return response
+
+
 async def main():
     """
     Asynchronous main function to initialize the application.
@@ -29,19 +50,27 @@ async def main():
     app.add_middleware(MetaTagInjectionMiddleware)
 
     public_dir = Path("public")
-    app.mount("/static", StaticFiles(directory=public_dir), name="static")
+    app.mount("/static", CachedStaticFiles(directory=public_dir), name="static")
 
     gr.mount_gradio_app(
         app=app,
         blocks=demo,
         path="/",
-        allowed_paths=["static"]
+        allowed_paths=["static", str(config.audio_dir)]
     )
 
-    import uvicorn
-    config = uvicorn.Config(app, host="0.0.0.0", port=7860, log_level="info")
-    server = uvicorn.Server(config)
-    await server.serve()
+    uvicorn_config = uvicorn.Config(app, host="0.0.0.0", port=7860, log_level="info")
+    server = uvicorn.Server(uvicorn_config)
+    audio_cleanup_task = asyncio.create_task(delete_old_audio_files_periodically(config))
+    try:
+        await server.serve()
+    finally:
+        audio_cleanup_task.cancel()
+        await asyncio.gather(
+            config.hume_config.aclose(),
+            config.elevenlabs_config.aclose(),
+            config.openai_config.aclose(),
+        )
 
 
 if __name__ == "__main__":
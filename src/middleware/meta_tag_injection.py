@@ -1,11 +1,13 @@
 # Standard Library Imports
-from typing import Awaitable, Callable, Dict, List
+import html
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 # Third-Party Library Imports
 from bs4 import BeautifulSoup
-from fastapi import Request
-from fastapi.responses import Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # HTML and social media metadata for the Gradio application
 # These tags define SEO-friendly content and provide rich previews when shared on social platforms
@@ -67,28 +69,79 @@ META_TAGS: List[Dict[str, str]] = [
     }
 ]
 
-def __update_meta_tags(html_content: str, meta_tags: List[Dict[str, str]]) -> str:
+# Pre-rendered META_TAGS markup, injected directly before the closing </head> tag of the root page
+_META_TAGS_HTML: bytes = "".join(
+    "<meta " + " ".join(f'{attr}="{html.escape(value)}"' for attr, value in meta_tag.items()) + ">"
+    for meta_tag in META_TAGS
+).encode("utf-8")
+
+# The (attribute type, attribute value) pairs, e.g. ('property', 'og:url'), identifying existing meta tags that
+# conflict with META_TAGS and must be removed before injection
+_META_TAG_CONFLICTS: FrozenSet[Tuple[str, str]] = frozenset(
+    (attr_type, meta_tag[attr_type])
+    for meta_tag in META_TAGS
+    for attr_type in ("name" if "name" in meta_tag else "property",)
+)
+
+# Matches existing meta tags in the head that share a name/property with one of META_TAGS
+_CONFLICTING_META_TAG_PATTERN = re.compile(
+    rb"<meta\b[^>]*?\s(?:"
+    + b"|".join(
+        re.escape(attr_type.encode("utf-8"))
+        + rb"""\s*=\s*["']"""
+        + re.escape(attr_value.encode("utf-8"))
+        + rb"""["']"""
+        for attr_type, attr_value in sorted(_META_TAG_CONFLICTS)
+    )
+    + rb")[^>]*>\s*",
+    re.IGNORECASE,
+)
+
+_HEAD_CLOSE_TAG = b"</head>"
+
+def _inject_meta_tags(html_content: bytes) -> bytes:
     """
-    Safely updates the HTML content by adding or replacing meta tags in the head section
+    Injects the pre-rendered META_TAGS into the head of an HTML document, operating directly on the raw bytes.
+
+    Existing meta tags that conflict with META_TAGS are removed from the head and the new tags are spliced in
+    directly before the closing </head> tag. Documents without a literal </head> tag fall back to parsing with
+    BeautifulSoup.
+
+    Args:
+        html_content: The original UTF-8 encoded HTML content
+
+    Returns:
+        The modified UTF-8 encoded HTML content with updated meta tags
+    """
+    head_end = html_content.find(_HEAD_CLOSE_TAG)
+    if head_end == -1:
+        return _update_meta_tags(html_content.decode("utf-8")).encode("utf-8")
+
+    head = _CONFLICTING_META_TAG_PATTERN.sub(b"", html_content[:head_end])
+    return b"".join((head, _META_TAGS_HTML, html_content[head_end:]))
+
+@lru_cache(maxsize=4)
+def _update_meta_tags(html_content: str) -> str:
+    """
+    Safely updates the HTML content by adding or replacing the META_TAGS meta tags in the head section
     without affecting other elements, especially scripts and event handlers.
 
+    This is the fallback used by `_inject_meta_tags` when the document has no literal closing </head> tag.
+    Results are memoized by HTML content to avoid re-parsing the same document on every page load.
+
     Args:
         html_content: The original HTML content as a string
-        meta_tags: A list of dictionaries with meta tag attributes to add
 
     Returns:
         The modified HTML content with updated meta tags
     """
+    meta_tags = META_TAGS
     # Parse the HTML
     soup = BeautifulSoup(html_content, 'html.parser')
     head = soup.head
 
     # Remove existing meta tags that would conflict with our new ones
-    for meta_tag in meta_tags:
-        # Determine if we're looking for 'name' or 'property' attribute
-        attr_type = 'name' if 'name' in meta_tag else 'property'
-        attr_value = meta_tag.get(attr_type)
-
+    for attr_type, attr_value in _META_TAG_CONFLICTS:
         # Find and remove existing meta tags with the same name/property
         existing_tags = head.find_all('meta', attrs={attr_type: attr_value})
         for tag in existing_tags:
@@ -103,53 +156,60 @@ def __update_meta_tags(html_content: str, meta_tags: List[Dict[str, str]]) -> st
 
     return str(soup)
 
-class MetaTagInjectionMiddleware(BaseHTTPMiddleware):
+class MetaTagInjectionMiddleware:
     """
-    FastAPI middleware that safely intercepts and modifies the HTML response from the root endpoint
+    ASGI middleware that safely intercepts and modifies the HTML response from the root endpoint
     to inject custom meta tags into the document head.
 
-    This middleware specifically targets the root path ('/') and leaves all other endpoint
-    responses unmodified. It uses BeautifulSoup to properly parse and modify the HTML,
-    ensuring that JavaScript functionality remains intact.
+    This middleware specifically targets the root path ('/'); all other requests are passed straight
+    through to the application without wrapping their responses. The meta tag markup is rendered once
+    at import and spliced into the raw HTML before the closing head tag, leaving scripts and other
+    elements untouched. BeautifulSoup is only used as a fallback for documents without a literal
+    closing head tag.
     """
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        # Process the request and get the response
-        response = await call_next(request)
-
-        # Only intercept responses from the root endpoint and HTML content
-        if request.url.path == "/" and response.headers.get("content-type", "").startswith("text/html"):
-            # Get the response body
-            response_body = b""
-            async for chunk in response.body_iterator:
-                response_body += chunk
 
-            try:
-                # Decode, modify, and re-encode the content
-                content = response_body.decode("utf-8")
-                modified_content = __update_meta_tags(content, META_TAGS).encode("utf-8")
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] != "/":
+            await self.app(scope, receive, send)
+            return
+
+        response_start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def send_with_meta_tags(message: Message) -> None:
+            nonlocal response_start
+
+            if message["type"] == "http.response.start":
+                # Only intercept HTML content; anything else is forwarded unmodified
+                if Headers(raw=message["headers"]).get("content-type", "").startswith("text/html"):
+                    response_start = message
+                else:
+                    await send(message)
+                return
 
+            if response_start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            # Collect the response body chunks and join them once the final chunk arrives
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            response_body = b"".join(chunks)
+            try:
+                # Splice the meta tags into the raw content
+                response_body = _inject_meta_tags(response_body)
                 # Update content-length header to reflect modified content size
-                headers = dict(response.headers)
-                headers["content-length"] = str(len(modified_content))
-
-                # Create a new response with the modified content
-                return Response(
-                    content=modified_content,
-                    status_code=response.status_code,
-                    headers=headers,
-                    media_type=response.media_type
-                )
+                MutableHeaders(scope=response_start)["content-length"] = str(len(response_body))
             except Exception:
-                # If there's an error, return the original response
-                return Response(
-                    content=response_body,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.media_type
-                )
-
-        return response
+                # If there's an error, send the original response
+                pass
+
+            await send(response_start)
+            await send({"type": "http.response.body", "body": response_body})
+
+        await self.app(scope, receive, send_with_meta_tags)